@@ -12,43 +12,113 @@
 
 .. include:: ../DOCUMENTATION.md
 """
-from cliconfig import (
-    _logger,
-    base,
-    cli_parser,
-    config_routines,
-    dict_routines,
-    process_routines,
-    processing,
-    tag_routines,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from cliconfig._logger import create_logger
 from cliconfig._version import __version__, __version_tuple__
-from cliconfig.base import Config
-from cliconfig.config_routines import (
-    flatten_config,
-    load_config,
-    make_config,
-    save_config,
-    show_config,
-    unflatten_config,
-    update_config,
-)
-from cliconfig.dict_routines import flatten as flatten_dict
-from cliconfig.dict_routines import unflatten as unflatten_dict
-from cliconfig.process_routines import (
-    merge_flat_paths_processing,
-    merge_flat_processing,
-)
-from cliconfig.processing.base import Processing
-from cliconfig.processing.builtin import DefaultProcessings
-from cliconfig.processing.create import (
-    create_processing_keep_property,
-    create_processing_value,
-)
+
+# Imports for type checking only, the public objects are imported lazily
+# on first access by the module __getattr__
+if TYPE_CHECKING:
+    from cliconfig import (
+        base,
+        cli_parser,
+        config_routines,
+        dict_routines,
+        process_routines,
+        processing,
+        tag_routines,
+    )
+    from cliconfig.base import Config
+    from cliconfig.config_routines import (
+        flatten_config,
+        load_config,
+        make_config,
+        save_config,
+        show_config,
+        unflatten_config,
+        update_config,
+    )
+    from cliconfig.dict_routines import clear_yaml_cache
+    from cliconfig.dict_routines import flatten as flatten_dict
+    from cliconfig.dict_routines import unflatten as unflatten_dict
+    from cliconfig.process_routines import (
+        merge_flat_paths_processing,
+        merge_flat_processing,
+    )
+    from cliconfig.processing.base import Processing
+    from cliconfig.processing.builtin import DefaultProcessings
+    from cliconfig.processing.create import (
+        create_processing_keep_property,
+        create_processing_value,
+    )
+
+_LAZY_MODULES = {
+    "base",
+    "cli_parser",
+    "config_routines",
+    "dict_routines",
+    "process_routines",
+    "processing",
+    "tag_routines",
+    "yaml_tags",
+}
+# Public name -> (module, name in the module)
+_LAZY_OBJECTS = {
+    "Config": ("cliconfig.base", "Config"),
+    "flatten_config": ("cliconfig.config_routines", "flatten_config"),
+    "load_config": ("cliconfig.config_routines", "load_config"),
+    "make_config": ("cliconfig.config_routines", "make_config"),
+    "save_config": ("cliconfig.config_routines", "save_config"),
+    "show_config": ("cliconfig.config_routines", "show_config"),
+    "unflatten_config": ("cliconfig.config_routines", "unflatten_config"),
+    "update_config": ("cliconfig.config_routines", "update_config"),
+    "clear_yaml_cache": ("cliconfig.dict_routines", "clear_yaml_cache"),
+    "flatten_dict": ("cliconfig.dict_routines", "flatten"),
+    "unflatten_dict": ("cliconfig.dict_routines", "unflatten"),
+    "merge_flat_paths_processing": (
+        "cliconfig.process_routines",
+        "merge_flat_paths_processing",
+    ),
+    "merge_flat_processing": ("cliconfig.process_routines", "merge_flat_processing"),
+    "Processing": ("cliconfig.processing.base", "Processing"),
+    "DefaultProcessings": ("cliconfig.processing.builtin", "DefaultProcessings"),
+    "create_processing_keep_property": (
+        "cliconfig.processing.create",
+        "create_processing_keep_property",
+    ),
+    "create_processing_value": (
+        "cliconfig.processing.create",
+        "create_processing_value",
+    ),
+}
 
 _CLICONFIG_LOGGER = create_logger()
 
+
+def __getattr__(name: str) -> Any:
+    """Import the public sub-modules and objects on first access."""
+    if name == "yaml_tags":
+        # Namespace package: import its module with it
+        importlib.import_module(f"{__name__}.yaml_tags._yaml_tags")
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_OBJECTS:
+        module_name, object_name = _LAZY_OBJECTS[name]
+        value = getattr(importlib.import_module(module_name), object_name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    # Cache the value in the module to not call __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the module, including the lazy ones."""
+    return sorted(set(globals()) | _LAZY_MODULES | set(_LAZY_OBJECTS))
+
+
 __all__ = [
     "__version__",
     "__version_tuple__",
@@ -58,6 +128,7 @@ __all__ = [
     "DefaultProcessings",
     "Processing",
     "base",
+    "clear_yaml_cache",
     "cli_parser",
     "config_routines",
     "create_processing_keep_property",
@@ -1,15 +1,37 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Logging functions for cliconfig."""
 import logging
+import os
 import sys
 from logging import Logger
 
+_HANDLER_NAME = "cliconfig"
+
 
 def create_logger() -> Logger:
-    """Create cliconfig logger."""
+    """Create cliconfig logger.
+
+    The handler is added only once, calling this function again only
+    updates its stream to the current standard output.
+    Only the warnings are logged if the environment variable `CLICONFIG_QUIET`
+    is set to a non-empty value other than "0".
+    """
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
+    quiet = os.environ.get("CLICONFIG_QUIET", "0") not in ("", "0")
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    for handler in logger.handlers:
+        if handler.get_name() == _HANDLER_NAME and isinstance(
+            handler, logging.StreamHandler
+        ):
+            if getattr(handler.stream, "closed", False):
+                # NOTE setStream flushes the old stream that fails if it is
+                # closed (e.g. a captured output that is no longer used)
+                handler.stream = sys.stdout
+            else:
+                handler.setStream(sys.stdout)
+            return logger
     handler = logging.StreamHandler(sys.stdout)
+    handler.set_name(_HANDLER_NAME)
     formatter = logging.Formatter("%(levelname)s - %(message)s")
     handler.setFormatter(formatter)
     logger.addHandler(handler)
@@ -6,6 +6,19 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 if TYPE_CHECKING:
     from cliconfig.processing.base import Processing
 
+# Real attributes of Config objects, other names are keys of the config dict
+_ATTRIBUTES = frozenset(("dict", "process_list", "_sub_configs"))
+# Sentinel for missing keys
+_MISSING = object()
+
+
+def _missing_key_error(name: str, config_dict: Dict[str, Any]) -> AttributeError:
+    """Build the error raised when accessing a missing key of a config."""
+    keys = ", ".join(config_dict.keys())
+    return AttributeError(
+        f"Config has no attribute '{name}'. Available keys are: {keys}."
+    )
+
 
 class Config:
     """Class for configuration.
@@ -15,6 +28,9 @@ class Config:
     `__getattribute__`, `__setattr__` and `__delattr__`.
     The Config objects are mutable and not hashable.
 
+    "dict", "process_list" and "_sub_configs" are reserved names of attributes
+    and can't be accessed as keys of the config dict with dots.
+
     Parameters
     ----------
     config_dict : Dict[str, Any]
@@ -36,17 +52,26 @@ class Config:
     2
     """
 
+    __slots__ = ("dict", "process_list", "_sub_configs")
+
+    dict: Dict[str, Any]
+    process_list: List["Processing"]
+    # Cache of the sub-configurations returned by __getattribute__,
+    # created on the first access to a sub-configuration
+    _sub_configs: Optional[Dict[str, "Config"]]
+
     def __init__(
         self,
         config_dict: Dict[str, Any],
         process_list: Optional[List["Processing"]] = None,
     ) -> None:
+        self._sub_configs = None
         self.dict = config_dict
         self.process_list = process_list if process_list else []
 
     def __dir__(self) -> List[str]:
         """List of attributes, sub-configurations and parameters."""
-        return ["dict", "process_list"] + list(self.dict.keys())
+        return ["dict", "process_list", *self.dict]
 
     def __repr__(self) -> str:
         """Representation of Config object."""
@@ -64,6 +89,9 @@ class Config:
             and self.dict == other.dict
             and len(self.process_list) == len(other.process_list)
         ):
+            if self.process_list == other.process_list:
+                # Fast path: same processings in the same order
+                return True
             equal = True
             for processing in self.process_list:
                 equal = equal and processing in other.process_list
@@ -79,18 +107,36 @@ class Config:
         you can apply `cliconfig.dict_routines.flatten` on `config.dict`
         to unflatten it.
         """
-        if __name in ["dict", "process_list"]:
-            return super().__getattribute__(__name)
-        if __name not in self.dict:
-            keys = ", ".join(self.dict.keys())
-            raise AttributeError(  # pylint: disable=raise-missing-from
-                f"Config has no attribute '{__name}'. Available keys are: {keys}."
-            )
-        if isinstance(self.dict[__name], dict):
+        get_attribute = super().__getattribute__
+        if __name in _ATTRIBUTES:
+            return get_attribute(__name)
+        config_dict = get_attribute("dict")
+        value = config_dict.get(__name, _MISSING)
+        if value is _MISSING:
+            raise _missing_key_error(__name, config_dict)
+        if isinstance(value, dict):
             # If the attribute is a dict, return a Config object
-            # so that we can access the nested keys with multiple dots
-            return Config(self.dict[__name], process_list=self.process_list)
-        return self.dict[__name]
+            # so that we can access the nested keys with multiple dots.
+            # The Config object is cached as long as it wraps the same dict
+            # and the same process list.
+            process_list = get_attribute("process_list")
+            sub_configs = get_attribute("_sub_configs")
+            if sub_configs is None:
+                sub_configs = {}
+                super().__setattr__("_sub_configs", sub_configs)
+            sub_config = sub_configs.get(__name)
+            if (
+                sub_config is None
+                or sub_config.dict is not value
+                or (
+                    sub_config.process_list is not process_list
+                    and (sub_config.process_list or process_list)
+                )
+            ):
+                sub_config = Config(value, process_list=process_list)
+                sub_configs[__name] = sub_config
+            return sub_config
+        return value
 
     def __setattr__(self, __name: str, value: Any) -> None:
         """Set attribute, sub-configuration or parameter.
@@ -99,10 +145,14 @@ class Config:
         you can apply `cliconfig.dict_routines.flatten` on `config.dict`
         to unflatten it.
         """
-        if __name in ["dict", "process_list"]:
+        if __name in _ATTRIBUTES:
             super().__setattr__(__name, value)
+            if __name == "dict" and self._sub_configs:
+                self._sub_configs.clear()
         else:
             self.dict[__name] = value
+            if self._sub_configs:
+                self._sub_configs.pop(__name, None)
 
     def __delattr__(self, __name: str) -> None:
         """Delete attribute, sub-configuration or parameter.
@@ -111,7 +161,9 @@ class Config:
         you can apply `cliconfig.dict_routines.flatten` on `config.dict`
         to unflatten it.
         """
-        if __name in ["dict", "process_list"]:
+        if __name in _ATTRIBUTES:
             super().__delattr__(__name)
         else:
             del self.dict[__name]
+            if self._sub_configs:
+                self._sub_configs.pop(__name, None)
@@ -1,8 +1,55 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Parsing functions from CLI."""
+import re
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
-import yaml
+# Plain scalars that can be converted without the yaml parser. They follow
+# the YAML 1.1 resolution of the yaml safe loader.
+_YAML_WORDS: Dict[str, Any] = {
+    **dict.fromkeys(["", "~", "null", "Null", "NULL"], None),
+    **dict.fromkeys(
+        ["true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"], True
+    ),
+    **dict.fromkeys(
+        ["false", "False", "FALSE", "no", "No", "NO", "off", "Off", "OFF"], False
+    ),
+}
+_INT_REGEX = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_FLOAT_REGEX = re.compile(r"[-+]?[0-9]+\.[0-9]*(?:[eE][-+][0-9]+)?")
+_STR_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_MISSING = object()
+
+
+def _fast_scalar(value_str: str) -> Any:
+    """Convert simple scalar values without the yaml parser.
+
+    Return `_MISSING` if the value must be parsed with yaml.
+    """
+    value = _YAML_WORDS.get(value_str, _MISSING)
+    if value is not _MISSING:
+        return value
+    if _INT_REGEX.fullmatch(value_str):
+        return int(value_str)
+    if _FLOAT_REGEX.fullmatch(value_str):
+        return float(value_str)
+    if _STR_REGEX.fullmatch(value_str):
+        return value_str
+    return _MISSING
+
+
+def _yaml_load(value_str: str) -> Any:
+    """Load a value with the yaml safe loader (with LibYAML if available).
+
+    PyYAML is imported on first use only, so that importing the CLI parser
+    stays fast.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    # Use the LibYAML bindings when PyYAML was built with them (much faster)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(value_str, Loader=loader)
 
 
 def parse_cli(sys_argv: List[str]) -> Tuple[List[str], Dict[str, Any]]:
@@ -25,6 +72,8 @@ def parse_cli(sys_argv: List[str]) -> Tuple[List[str], Dict[str, Any]]:
     ------
     Value Error
         If the `--config` argument (with space) is used more than once.
+    Value Error
+        If the `--config` argument (with space) is not followed by a value.
 
     Returns
     -------
@@ -46,34 +95,44 @@ def parse_cli(sys_argv: List[str]) -> Tuple[List[str], Dict[str, Any]]:
     """
     cli_params_dict: Dict[str, Any] = {}
     config_paths: List[str] = []
-    i = 0
-    while i < len(sys_argv):
-        elem = sys_argv[i]
+    argv_iter = iter(sys_argv)
+    for elem in argv_iter:
         if elem == "--config":
             if config_paths:
                 raise ValueError(
                     "Only one '--config ' argument is allowed in CLI (used for "
                     "config merging)."
                 )
-            configs = yaml.safe_load(sys_argv[i + 1])
+            configs_str = next(argv_iter, None)
+            if configs_str is None:
+                raise ValueError("Missing config path(s) after '--config ' in CLI.")
+            configs = _yaml_load(configs_str)
             if isinstance(configs, list):
                 config_paths = configs
             if isinstance(configs, str):
-                config_paths = sys_argv[i + 1].split(",")
-            i += 2
+                config_paths = configs_str.split(",")
         elif elem.startswith("--"):
-            splits = elem.split("=", maxsplit=1)
-            if len(splits) == 2:
-                key, value_str = splits
-            else:
-                key = splits[0]
+            key, sep, value_str = elem[2:].partition("=")
+            if not sep:
                 # If no value is provided, use True because it could
                 # be seen as a flag
                 value_str = "true"
-            key = key[2:]
-            value = yaml.safe_load(value_str)
+            value = _fast_scalar(value_str)
+            if value is _MISSING:
+                value = _yaml_load(value_str)
             cli_params_dict[key] = value
-            i += 1
-        else:  # Not a config parameter
-            i += 1
     return config_paths, cli_params_dict
+
+
+def _parse_cli_cached(sys_argv: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+    """Parse CLI like `parse_cli` but with a cache on the arguments.
+
+    The outputs are copies and can be safely modified.
+    """
+    return deepcopy(_parse_cli_tuple(tuple(sys_argv)))
+
+
+@lru_cache(maxsize=16)
+def _parse_cli_tuple(sys_argv: Tuple[str, ...]) -> Tuple[List[str], Dict[str, Any]]:
+    """Call `parse_cli` on hashable arguments (to cache the outputs)."""
+    return parse_cli(list(sys_argv))
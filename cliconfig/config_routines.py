@@ -2,12 +2,19 @@
 """Low-level and high-level functions to manipulate config."""
 import sys
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import cliconfig
 from cliconfig.base import Config
-from cliconfig.cli_parser import parse_cli
-from cliconfig.dict_routines import flatten, show_dict, unflatten
+from cliconfig.cli_parser import _parse_cli_cached
+from cliconfig.dict_routines import (
+    _flat_key,
+    _NestedUpdateError,
+    _update_nested,
+    flatten,
+    show_dict,
+    unflatten,
+)
 from cliconfig.process_routines import (
     end_build_processing,
     load_processing,
@@ -86,15 +93,15 @@ def make_config(
     """
     logger = cliconfig._CLICONFIG_LOGGER  # pylint: disable=W0212
     # Create the processing list
-    process_list_: List[Processing] = [] if process_list is None else process_list
+    process_list_: List[Processing] = list(process_list or ())
     if add_default_processing:
-        process_list_ += DefaultProcessings().list
+        process_list_.extend(DefaultProcessings().list)
     config = Config({}, process_list_)
     if no_cli:
         additional_config_paths: List[str] = []
         cli_params_dict: Dict[str, Any] = {}
     else:
-        additional_config_paths, cli_params_dict = parse_cli(sys.argv)
+        additional_config_paths, cli_params_dict = _parse_cli_cached(sys.argv[1:])
         if not additional_config_paths and fallback:
             # Add fallback config
             additional_config_paths = [fallback]
@@ -108,43 +115,93 @@ def make_config(
                 path,
                 allow_new_keys=allow_new_keys,
                 preprocess_first=False,  # Already processed
+                inplace=True,  # The previous config is no longer used
             )
 
     # Allow new keys for CLI parameters but do not merge them and raise
     # warning.
-    cli_params_dict = flatten(cli_params_dict)
-    new_keys, keys = [], list(cli_params_dict.keys())
-    for key in keys:
-        if (
-            not is_tag_in(key, "new", full_key=True)
-            and clean_all_tags(key) not in config.dict
-        ):
-            # New key: delete it
-            new_keys.append(clean_all_tags(key))
-            del cli_params_dict[key]
+    cli_params_dict, new_keys = _flatten_filter_cli_params(
+        cli_params_dict, config.dict
+    )
     if new_keys:
-        new_keys_message = "  - " + "\n  - ".join(new_keys)
-        message = (
-            "[CONFIG] New keys found in CLI parameters "
-            f"that will not be merged:\n{new_keys_message}"
+        logger.warning(
+            "[CONFIG] New keys found in CLI parameters that will not be merged:\n%s",
+            "  - " + "\n  - ".join(new_keys),
         )
-        logger.warning(message)
     # Merge CLI parameters
     cli_params_config = Config(cli_params_dict, [])
     config = merge_flat_processing(
-        config, cli_params_config, allow_new_keys=False, preprocess_first=False
+        config,
+        cli_params_config,
+        allow_new_keys=False,
+        preprocess_first=False,
+        inplace=True,
     )
-    message = (
-        f"[CONFIG] Merged {len(default_config_paths)} default config(s), "
-        f"{len(additional_config_paths)} additional config(s) and "
-        f"{len(cli_params_dict)} CLI parameter(s)."
+    logger.info(
+        "[CONFIG] Merged %d default config(s), %d additional config(s) and "
+        "%d CLI parameter(s).",
+        len(default_config_paths),
+        len(additional_config_paths),
+        len(cli_params_dict),
     )
-    logger.info(message)
     config = end_build_processing(config)
     config.dict = unflatten(config.dict)
     return config
 
 
+def _flatten_filter_cli_params(
+    cli_params_dict: Dict[str, Any], flat_config_dict: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Flatten the CLI parameters and remove the new ones in a single pass.
+
+    A parameter is new if its key (without tags) is not in the flat config dict
+    and if it is not tagged with "@new".
+
+    Raises
+    ------
+    ValueError
+        If there are duplicated keys when flattening the CLI parameters.
+
+    Returns
+    -------
+    flat_params_dict : Dict[str, Any]
+        The flat dict of the CLI parameters to merge.
+    new_keys : List[str]
+        The new keys without tags, that will not be merged.
+    """
+    flat_params_dict: Dict[str, Any] = {}
+    new_keys: List[str] = []
+    visited_keys = set()
+    # Same depth-first walk as `cliconfig.dict_routines.flatten`
+    stack: List[Tuple[Any, Iterator[Tuple[Any, Any]]]] = [
+        (None, iter(cli_params_dict.items()))
+    ]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            flat_key = _flat_key(prefix, key)
+            if isinstance(value, dict):
+                if value:
+                    stack.append((flat_key, iter(value.items())))
+                    break
+                # Ignore nested empty dicts
+                continue
+            if flat_key in visited_keys:
+                raise ValueError(f"duplicated key '{flat_key}'")
+            visited_keys.add(flat_key)
+            if is_tag_in(flat_key, "new", full_key=True):
+                flat_params_dict[flat_key] = value
+                continue
+            clean_key = clean_all_tags(flat_key)
+            if clean_key in flat_config_dict:
+                flat_params_dict[flat_key] = value
+            else:
+                new_keys.append(clean_key)
+        else:
+            stack.pop()
+    return flat_params_dict, new_keys
+
+
 def load_config(
     path: str,
     default_config_paths: Optional[List[str]] = None,
@@ -187,9 +244,9 @@ def load_config(
         adapt the config file if the default configs have changed.
     """
     # Crate process_list
-    process_list_: List[Processing] = [] if process_list is None else process_list
+    process_list_: List[Processing] = list(process_list or ())
     if add_default_processing:
-        process_list_ += DefaultProcessings().list
+        process_list_.extend(DefaultProcessings().list)
 
     config = Config({}, process_list_)
     if default_config_paths:
@@ -199,6 +256,7 @@ def load_config(
                 config_path,
                 allow_new_keys=True,
                 preprocess_first=False,  # Already processed
+                inplace=True,  # The previous config is no longer used
             )
     loaded_config = load_processing(path, config.process_list)
     # Update the config list from loaded_config in config
@@ -211,6 +269,7 @@ def load_config(
         loaded_config,
         allow_new_keys=default_config_paths is None,
         preprocess_first=False,
+        inplace=True,
     )
     config = end_build_processing(config)
     config.dict = unflatten(config.dict)
@@ -306,6 +365,15 @@ def update_config(
         The updated config.
     """
     other_config = Config(other, []) if isinstance(other, dict) else other
+    if not config.process_list and not other_config.process_list:
+        # No processing to trigger: update the nested dicts directly
+        try:
+            config_dict = _update_nested(
+                config.dict, other_config.dict, allow_new_keys=allow_new_keys
+            )
+            return Config(config_dict, [])
+        except _NestedUpdateError:
+            pass  # Use the flat merge that supports all the cases
     config = merge_flat_processing(
         config,
         other_config,
@@ -4,14 +4,17 @@
 Used by `cliconfig.process_routines` and `cliconfig.config_routines`.
 """
 import os
-from typing import Any, Dict, Tuple, Union
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
-import yaml
-from flatten_dict import flatten as _flatten
-from flatten_dict import unflatten as _unflatten
-from yaml.parser import ParserError
+# NOTE yaml (and the tag loader built on it) is imported on first load or save
+# only to not import it with the routines that manipulate the dicts
 
-from cliconfig.yaml_tags._yaml_tags import get_yaml_loader, insert_tags
+# Cache of the flat dicts loaded by load_dict, keyed by (real path, mtime, size)
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_YAML_CACHE_MAX_SIZE = 128
 
 
 def merge_flat(
@@ -19,6 +22,7 @@ def merge_flat(
     dict2: Dict[str, Any],
     *,
     allow_new_keys: bool = True,
+    inplace: bool = False,
 ) -> Dict[str, Any]:
     """Flatten then merge dict2 into dict1. The result is flat.
 
@@ -38,6 +42,10 @@ def merge_flat(
     allow_new_keys : bool, optional
         If True, new keys (that are not in dict1) are allowed in dict2.
         By default True.
+    inplace : bool, optional
+        If True, the flat version of dict1 is updated in place and returned
+        instead of being copied. Useful when dict1 is no longer used after
+        the merge. By default False.
 
     Raises
     ------
@@ -66,9 +74,26 @@ def merge_flat(
     """
     # Flatten dicts
     flat_dict1, flat_dict2 = _flat_before_merge(dict1, dict2)
+    return _merge_flat_dicts(
+        flat_dict1, flat_dict2, allow_new_keys=allow_new_keys, inplace=inplace
+    )
+
 
-    if not allow_new_keys:
-        # Check that there are no new keys in dict2
+def _merge_flat_dicts(
+    flat_dict1: Dict[str, Any],
+    flat_dict2: Dict[str, Any],
+    *,
+    allow_new_keys: bool,
+    inplace: bool,
+) -> Dict[str, Any]:
+    """Merge two dicts that are already flat."""
+    if not flat_dict2 or flat_dict2 is flat_dict1:
+        # Nothing to merge
+        return flat_dict1 if inplace else flat_dict1.copy()
+
+    # Check that there are no new keys in dict2 (the subset test runs in C,
+    # the keys are only scanned in Python to report the first new one)
+    if not allow_new_keys and not flat_dict2.keys() <= flat_dict1.keys():
         for key in flat_dict2:
             if key not in flat_dict1:
                 raise ValueError(
@@ -76,31 +101,111 @@ def merge_flat(
                     "dict."
                 )
     # Merge flat dicts
-    flat_dict = {**flat_dict1, **flat_dict2}
+    if inplace:
+        flat_dict1.update(flat_dict2)
+        return flat_dict1
+    flat_dict = flat_dict1.copy()
+    flat_dict.update(flat_dict2)
     return flat_dict
 
 
+def _update_nested(
+    dict1: Dict[str, Any],
+    dict2: Dict[str, Any],
+    *,
+    allow_new_keys: bool,
+) -> Dict[str, Any]:
+    """Update a copy of a nested dict with another nested dict.
+
+    Equivalent to merging the flat dicts then unflattening the result but
+    without building and splitting the flat keys. Raise `_NestedUpdateError`
+    for the cases that only the flat merge supports: flat (dotted) or
+    non-string keys, empty sub-dicts and dicts replacing values or the opposite.
+    It is also raised for new keys when they are not allowed to let the flat
+    merge report the error.
+    """
+    out_dict = _copy_nested(dict1)
+    # Stack of (dict to update, iterator over the items to update it with)
+    stack = [(out_dict, iter(dict2.items()))]
+    while stack:
+        sub_dict, items = stack[-1]
+        for key, value in items:
+            if not isinstance(key, str) or "." in key:
+                raise _NestedUpdateError
+            is_dict = isinstance(value, dict)
+            if is_dict and not value:
+                raise _NestedUpdateError
+            if key not in sub_dict:
+                if not allow_new_keys:
+                    raise _NestedUpdateError
+                sub_dict[key] = _copy_nested(value) if is_dict else value
+            elif is_dict != isinstance(sub_dict[key], dict):
+                raise _NestedUpdateError
+            elif is_dict:
+                stack.append((sub_dict[key], iter(value.items())))
+                break
+            else:
+                sub_dict[key] = value
+        else:
+            stack.pop()
+    return out_dict
+
+
+def _copy_nested(in_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the sub-dicts of a nested dict (not the values).
+
+    Raise `_NestedUpdateError` if the dict has flat (dotted) or non-string keys
+    or empty sub-dicts.
+    """
+    out_dict: Dict[str, Any] = {}
+    stack = [(out_dict, in_dict)]
+    while stack:
+        sub_out, sub_in = stack.pop()
+        for key, value in sub_in.items():
+            if not isinstance(key, str) or "." in key:
+                raise _NestedUpdateError
+            if isinstance(value, dict):
+                if not value:
+                    raise _NestedUpdateError
+                sub_out[key] = {}
+                stack.append((sub_out[key], value))
+            else:
+                sub_out[key] = value
+    return out_dict
+
+
+class _NestedUpdateError(Exception):
+    """Error raised when a nested dict can't be updated without flattening it."""
+
+
 def _flat_before_merge(
     dict1: Dict[str, Any], dict2: Dict[str, Any]
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Flatten two dicts to merge them later."""
-    # Flatten dicts
-    flat_dicts = []
-    for i, _dict in enumerate([dict1, dict2]):
-        # Check if already flat
-        is_flat = all(not isinstance(val, dict) for val in _dict.values())
-        if not is_flat:
-            try:
-                flat_dict = flatten(_dict)
-            except ValueError as exc:
-                raise ValueError(
-                    f"Duplicated key found in dict {i + 1} when flattening. "
-                    f"You may consider calling 'clean_pre_flat' before merging."
-                ) from exc
-        else:
-            flat_dict = _dict
-        flat_dicts.append(flat_dict)
-    return flat_dicts[0], flat_dicts[1]
+    return _flat_one_before_merge(dict1, 1), _flat_one_before_merge(dict2, 2)
+
+
+def _flat_one_before_merge(in_dict: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Flatten a dict to merge it later if it is not already flat."""
+    if _is_flat(in_dict):
+        # Common case: the configs stay flat during the merges
+        return in_dict
+    try:
+        return flatten(in_dict)
+    except ValueError as exc:
+        raise ValueError(
+            f"Duplicated key found in dict {index} when flattening. "
+            f"You may consider calling 'clean_pre_flat' before merging."
+        ) from exc
+
+
+def _is_flat(in_dict: Dict[str, Any]) -> bool:
+    """Check if a dict is flat (no dict in its values)."""
+    # A plain loop is faster than all() with a generator
+    for val in in_dict.values():
+        if isinstance(val, dict):
+            return False
+    return True
 
 
 def merge_flat_paths(
@@ -193,10 +298,42 @@ def flatten(in_dict: Dict[str, Any]) -> Dict[str, Any]:
     .. note::
         Nested empty dict are ignored even if they are conflicting (see last example).
     """
-    flat_dict = _flatten(in_dict, reducer="dot")
+    flat_dict: Dict[str, Any] = {}
+    # Stack of (flat key prefix, iterator over the items of a sub-dict) to walk
+    # the nested dicts depth-first while keeping the order of the keys
+    stack: List[Tuple[Any, Iterator[Tuple[Any, Any]]]] = [(None, iter(in_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            flat_key = _flat_key(prefix, key)
+            if isinstance(value, dict):
+                if value:
+                    stack.append((flat_key, iter(value.items())))
+                    break
+                # Ignore nested empty dicts
+                continue
+            if flat_key in flat_dict:
+                raise ValueError(f"duplicated key '{flat_key}'")
+            flat_dict[flat_key] = value
+        else:
+            stack.pop()
     return flat_dict
 
 
+def _flat_key(prefix: Any, key: Any) -> Any:
+    """Build the flat key of a key under a flat prefix (None at the root).
+
+    The flat keys are interned as they are looked up and compared
+    many times during the merges and processings.
+    """
+    if prefix is not None:
+        return sys.intern(f"{prefix}.{key}")
+    if type(key) is str:  # pylint: disable=unidiomatic-typecheck
+        # NOTE sys.intern doesn't accept str subclasses
+        return sys.intern(key)
+    return key
+
+
 def unflatten(flat_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Unflatten a flat dict then return it.
 
@@ -224,8 +361,27 @@ def unflatten(flat_dict: Dict[str, Any]) -> Dict[str, Any]:
     ValueError: duplicated key 'a'
     The dict must be flatten before calling unflatten function.
     """
+    unflat_dict: Dict[str, Any] = {}
+    # Sub-dicts of the parent flat keys already walked, to walk each parent
+    # flat key only once
+    parents: Dict[str, Dict[str, Any]] = {}
     try:
-        unflat_dict = _unflatten(flat_dict, splitter="dot")
+        for flat_key, value in flat_dict.items():
+            parent_key, dot, last_key = flat_key.rpartition(".")
+            if not dot:
+                sub_dict = unflat_dict
+            elif parent_key in parents:
+                sub_dict = parents[parent_key]
+            else:
+                sub_dict = unflat_dict
+                for key in parent_key.split("."):
+                    sub_dict = sub_dict.setdefault(key, {})
+                    if not isinstance(sub_dict, dict):
+                        raise ValueError(f"duplicated key '{key}'")
+                parents[parent_key] = sub_dict
+            if last_key in sub_dict:
+                raise ValueError(f"duplicated key '{last_key}'")
+            sub_dict[last_key] = value
     except ValueError as exc:
         raise ValueError(
             "The dict must be flatten before calling unflatten function."
@@ -280,17 +436,29 @@ def clean_pre_flat(in_dict: Dict[str, Any], priority: str) -> Dict[str, Any]:
     """
     if priority in ("flat", "unflat"):
         # Check that there are no conflicts
-        flat_part = dict(filter(lambda items: "." in items[0], in_dict.items()))
-        unflat_part = dict(filter(lambda items: "." not in items[0], in_dict.items()))
+        flat_part: Dict[str, Any] = {}
+        unflat_part: Dict[str, Any] = {}
+        for key, value in in_dict.items():
+            if "." in key:
+                flat_part[key] = value
+            else:
+                unflat_part[key] = value
+        if not unflat_part:
+            # Fully flat dict: no possible conflict
+            return in_dict
+        # NOTE The nested part is always flattened: it raises an error
+        # if it has conflicts itself
         unflat_part_flat = flatten(unflat_part)
-        if priority == "unflat":
-            for key in flat_part:
-                if key in unflat_part_flat:
-                    _del_key(in_dict, key, keep_flat=False, keep_unflat=True)
-        else:
-            for key in unflat_part_flat:
-                if key in flat_part:
-                    _del_key(in_dict, key, keep_flat=True, keep_unflat=False)
+        # Only the conflicting keys are visited (the order of the deletions
+        # doesn't matter)
+        conflicts = flat_part.keys() & unflat_part_flat.keys()
+        for key in conflicts:
+            _del_key(
+                in_dict,
+                key,
+                keep_flat=priority == "flat",
+                keep_unflat=priority == "unflat",
+            )
     elif priority == "error":
         flatten(in_dict)  # Will raise an error if there are conflicts
     else:
@@ -358,37 +526,24 @@ def _del_key(
         found_key = True
         del in_dict[flat_key]
 
-    def recursive_del_key(
-        in_dict: Dict[str, Any], key: str, *, found_key: bool
-    ) -> bool:
-        first_key, *other_keys = key.split(".", 1)
-        if other_keys:
-            if first_key in in_dict:
-                # Delete key in sub-dict
-                new_key = recursive_del_key(
-                    in_dict[first_key],
-                    ".".join(other_keys),
-                    found_key=found_key,
-                )
-                found_key = found_key or new_key
-                # Remove if empty
-                if in_dict[first_key] == {}:
-                    del in_dict[first_key]
-            else:
-                # No key found, return input found_key
-                return found_key
-        else:
-            if first_key in in_dict:
-                found_key = True
-                del in_dict[first_key]
-            else:
-                # No key found, return input found_key
-                return found_key
-        return found_key
-
     if not keep_unflat:
         # Remove flat_key if it exists in a nested dict
-        found_key = recursive_del_key(in_dict, flat_key, found_key=found_key)
+        *parent_keys, last_key = flat_key.split(".")
+        parents = []  # (parent dict, key of the sub-dict) along the path
+        sub_dict = in_dict
+        for key in parent_keys:
+            if key not in sub_dict:
+                break
+            parents.append((sub_dict, key))
+            sub_dict = sub_dict[key]
+        else:
+            if last_key in sub_dict:
+                found_key = True
+                del sub_dict[last_key]
+        # Remove the sub-dicts that are empty, from the deepest one
+        for parent, key in reversed(parents):
+            if parent[key] == {}:
+                del parent[key]
     # Raise error if key not found
     if not found_key:
         raise ValueError(f"Key '{flat_key}' not found in dict.")
@@ -404,10 +559,14 @@ def save_dict(in_dict: Dict[str, Any], path: str) -> None:
     path : str
         The path to the yaml file to save the dict.
     """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    # Use the LibYAML bindings when PyYAML was built with them (much faster)
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
     dir_path = os.path.dirname(path)
     os.makedirs(dir_path, exist_ok=True)
     with open(path, "w", encoding="utf-8") as cfg_file:
-        yaml.dump(in_dict, cfg_file, default_flow_style=False)
+        yaml.dump(in_dict, cfg_file, Dumper=dumper, default_flow_style=False)
 
 
 def load_dict(path: str) -> Dict[str, Any]:
@@ -432,17 +591,60 @@ def load_dict(path: str) -> Dict[str, Any]:
         To use multiple yaml tags, separate them with "@". E.g. `!tag1@tag2`.
 
         You can combine any number of yaml and cliconfig tags together.
+
+        The loaded dicts are cached and the file is parsed again only if its
+        modification time or its size has changed. Use `clear_yaml_cache`
+        to empty the cache.
     """
+    return unflatten(_load_flat_dict(path))
+
+
+def _load_flat_dict(path: str) -> Dict[str, Any]:
+    """Load the flat dict of a yaml file path, using the cache of `load_dict`."""
+    stat = os.stat(path)
+    cache_key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+    if cache_key in _YAML_CACHE:
+        _YAML_CACHE.move_to_end(cache_key)
+        return deepcopy(_YAML_CACHE[cache_key])
+    # Intern the keys as the already flat dicts are not flattened when merged
+    out_dict = {_flat_key(None, key): val for key, val in _load_yaml(path).items()}
+    _YAML_CACHE[cache_key] = deepcopy(out_dict)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return out_dict
+
+
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Parse a yaml file and return the flat dict (without cache)."""
+    # pylint: disable=import-outside-toplevel
+    from yaml.parser import ParserError
+
+    from cliconfig.yaml_tags._yaml_tags import get_yaml_loader, insert_tags
+
     try:
         with open(path, "r", encoding="utf-8") as cfg_file:
-            file_dicts = yaml.load_all(cfg_file, Loader=get_yaml_loader())
-            out_dict: Dict[str, Any] = {}
-            for file_dict in file_dicts:
-                new_dict, _ = insert_tags(file_dict)
-                out_dict = merge_flat(out_dict, new_dict, allow_new_keys=True)
+            loader = get_yaml_loader()(cfg_file)
+            try:
+                out_dict: Dict[str, Any] = {}
+                while loader.check_data():
+                    loader.has_tags = False
+                    file_dict = loader.get_data()
+                    if loader.has_tags:
+                        # Insert the yaml tags in the keys (the tree is rebuilt)
+                        file_dict, _ = insert_tags(file_dict)
+                    out_dict = merge_flat(
+                        out_dict, file_dict, allow_new_keys=True, inplace=True
+                    )
+            finally:
+                loader.dispose()
     except ParserError as exc:
         raise ParserError(f"Error when parsing yaml file '{path}'.") from exc
-    return unflatten(out_dict)
+    return out_dict
+
+
+def clear_yaml_cache() -> None:
+    """Clear the cache of the dicts loaded from yaml files by `load_dict`."""
+    _YAML_CACHE.clear()
 
 
 def show_dict(in_dict: Dict[str, Any], start_indent: int = 0) -> None:
@@ -458,17 +660,23 @@ def show_dict(in_dict: Dict[str, Any], start_indent: int = 0) -> None:
         The number of starting tab indent (4 spaces), by default 0.
     """
     in_dict = unflatten(in_dict)
+    # Build all the lines then print them at once, printing each key
+    # separately is slow for large configs
+    lines: List[str] = []
 
-    def pretty_print(in_dict: Dict[str, Any], indent: int) -> None:
-        """Pretty print the dict recursively."""
+    def pretty_lines(in_dict: Dict[str, Any], indent: int) -> None:
+        """Build the lines of the dict recursively."""
+        indent_str = "    " * indent
         for key, value in in_dict.items():
-            print(f"{'    ' * indent}{key}: ", end="")
+            line = f"{indent_str}{key}: "
             if isinstance(value, dict):
-                print()
-                pretty_print(value, indent + 1)
+                lines.append(line)
+                pretty_lines(value, indent + 1)
             elif isinstance(value, str):
-                print(f"'{value}'")
+                lines.append(f"{line}'{value}'")
             else:
-                print(value)
+                lines.append(f"{line}{value}")
 
-    pretty_print(in_dict, start_indent)
+    pretty_lines(in_dict, start_indent)
+    if lines:
+        print("\n".join(lines))
@@ -3,19 +3,29 @@
 
 Used by `cliconfig.config_routines`.
 """
+from operator import attrgetter
 from typing import List, Optional, Union
 
 from cliconfig.base import Config
 from cliconfig.dict_routines import (
     _flat_before_merge,
+    _flat_one_before_merge,
+    _is_flat,
+    _load_flat_dict,
+    _merge_flat_dicts,
     flatten,
-    load_dict,
-    merge_flat,
     save_dict,
     unflatten,
 )
 from cliconfig.processing.base import Processing
 
+# Sort keys of the processings for each step (faster than lambdas)
+_PREMERGE_ORDER = attrgetter("premerge_order")
+_POSTMERGE_ORDER = attrgetter("postmerge_order")
+_PRESAVE_ORDER = attrgetter("presave_order")
+_POSTLOAD_ORDER = attrgetter("postload_order")
+_ENDBUILD_ORDER = attrgetter("endbuild_order")
+
 
 def merge_flat_processing(
     config1: Config,
@@ -25,6 +35,7 @@ def merge_flat_processing(
     preprocess_first: bool = True,
     preprocess_second: bool = True,
     postprocess: bool = True,
+    inplace: bool = False,
 ) -> Config:
     """Flatten and merge config2 into config1 and apply pre and post processing.
 
@@ -48,6 +59,10 @@ def merge_flat_processing(
         If True, apply pre-merge processing to config2. By default True.
     postprocess : bool, optional
         If True, apply post-merge processing to the merged config. By default True.
+    inplace : bool, optional
+        If True, the flat dict of config1 is updated in place instead of
+        being copied. Useful when config1 is no longer used after the merge.
+        By default False.
 
     Raises
     ------
@@ -65,31 +80,49 @@ def merge_flat_processing(
     config1.dict, config2.dict = _flat_before_merge(config1.dict, config2.dict)
     # Get the process list of the merge
     process_list = config1.process_list
-    for process in config2.process_list:
-        # NOTE 2 processings are equal if they are the same class and add the same
-        # attributes.
-        if process not in process_list:
-            process_list.append(process)
+    if config2.process_list and config2.process_list is not process_list:
+        # The processings are often shared by the configs: check the identities
+        # first to not compare their attributes
+        process_ids = {id(process) for process in process_list}
+        for process in config2.process_list:
+            # NOTE 2 processings are equal if they are the same class and add the
+            # same attributes.
+            if id(process) not in process_ids and process not in process_list:
+                process_list.append(process)
+                process_ids.add(id(process))
+    if not process_list:
+        # No processing to apply, only merge the flat dicts
+        flat_dict = _merge_flat_dicts(
+            config1.dict, config2.dict, allow_new_keys=allow_new_keys, inplace=inplace
+        )
+        return Config(flat_dict, process_list)
     # Apply the pre-merge processing
     if preprocess_first:
         config1.process_list = process_list
-        pre_order_list = sorted(process_list, key=lambda x: x.premerge_order)
+        pre_order_list = sorted(process_list, key=_PREMERGE_ORDER)
         for processing in pre_order_list:
             config1 = processing.premerge(config1)
         process_list = config1.process_list
     if preprocess_second:
         config2.process_list = process_list
-        pre_order_list = sorted(process_list, key=lambda x: x.premerge_order)
+        pre_order_list = sorted(process_list, key=_PREMERGE_ORDER)
         for processing in pre_order_list:
             config2 = processing.premerge(config2)
         process_list = config2.process_list
-    # Merge the dictionaries
-    flat_dict = merge_flat(config1.dict, config2.dict, allow_new_keys=allow_new_keys)
+    # Merge the dictionaries. Only the dicts modified by the pre-merge
+    # processing need to be checked again before merging.
+    if preprocess_first:
+        config1.dict = _flat_one_before_merge(config1.dict, 1)
+    if preprocess_second:
+        config2.dict = _flat_one_before_merge(config2.dict, 2)
+    flat_dict = _merge_flat_dicts(
+        config1.dict, config2.dict, allow_new_keys=allow_new_keys, inplace=inplace
+    )
     # Create the new config
     flat_config = Config(flat_dict, process_list)
     # Apply the postmerge processing
     if postprocess:
-        post_order_list = sorted(process_list, key=lambda x: x.postmerge_order)
+        post_order_list = sorted(process_list, key=_POSTMERGE_ORDER)
         for processing in post_order_list:
             flat_config = processing.postmerge(flat_config)
     return flat_config
@@ -104,6 +137,7 @@ def merge_flat_paths_processing(
     preprocess_first: bool = True,
     preprocess_second: bool = True,
     postprocess: bool = True,
+    inplace: bool = False,
 ) -> Config:
     """Flatten, merge and apply processing to two configs or their yaml paths.
 
@@ -132,6 +166,10 @@ def merge_flat_paths_processing(
         If True, apply pre-merge processing to config2. By default True.
     postprocess : bool, optional
         If True, apply post-merge processing to the merged config. By default True.
+    inplace : bool, optional
+        If True, the flat dict of the first config is updated in place instead of
+        being copied. Useful when the first config is no longer used after the
+        merge. By default False.
 
     Raises
     ------
@@ -148,8 +186,8 @@ def merge_flat_paths_processing(
     configs = []
     for config_or_path in [config_or_path1, config_or_path2]:
         if isinstance(config_or_path, str):
-            config_dict = load_dict(config_or_path)
-            config = Config(config_dict, [])
+            # Owned by the merge: load it flat to not unflatten and flatten it again
+            config = Config(_load_flat_dict(config_or_path), [])
         elif isinstance(config_or_path, Config):
             config = config_or_path
         elif isinstance(config_or_path, dict):
@@ -174,6 +212,7 @@ def merge_flat_paths_processing(
         preprocess_first=preprocess_first,
         preprocess_second=preprocess_second,
         postprocess=postprocess,
+        inplace=inplace,
     )
     return flat_config
 
@@ -188,9 +227,12 @@ def save_processing(config: Config, path: str) -> None:
     path : str
         The path to the yaml file to save the config dict.
     """
-    config_to_save = Config(flatten(config.dict), config.process_list)
+    # Copy the dict to not modify the config with the pre-save processing
+    # (flatten already makes a copy)
+    flat_dict = config.dict.copy() if _is_flat(config.dict) else flatten(config.dict)
+    config_to_save = Config(flat_dict, config.process_list)
     # Get the pre-save order
-    order_list = sorted(config.process_list, key=lambda x: x.presave_order)
+    order_list = sorted(config.process_list, key=_PRESAVE_ORDER)
     # Apply the pre-save processing
     for processing in order_list:
         config_to_save = processing.presave(config_to_save)
@@ -216,11 +258,10 @@ def load_processing(path: str, process_list: List[Processing]) -> Config:
     flat_config : Config
         The loaded flat config.
     """
-    # Load the dict and flatten it
-    out_dict = flatten(load_dict(path))
-    flat_config = Config(out_dict, process_list)
+    # Load the flat dict
+    flat_config = Config(_load_flat_dict(path), process_list)
     # Get the post-load order
-    order_list = sorted(process_list, key=lambda x: x.postload_order)
+    order_list = sorted(process_list, key=_POSTLOAD_ORDER)
     # Apply the post-load processing
     for processing in order_list:
         flat_config = processing.postload(flat_config)
@@ -243,7 +284,7 @@ def end_build_processing(flat_config: Config) -> Config:
     flat_config : Config
         The flat config after applying the end-build processings.
     """
-    order_list = sorted(flat_config.process_list, key=lambda x: x.endbuild_order)
+    order_list = sorted(flat_config.process_list, key=_ENDBUILD_ORDER)
     for processing in order_list:
         flat_config = processing.endbuild(flat_config)
     return flat_config
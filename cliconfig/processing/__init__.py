@@ -25,3 +25,27 @@ customize the methods you want among the five ones.
  * cliconfig.processing.builtin: Contains the default processings.
  * cliconfig.processing.create: Contains support functions to create processing.
 """
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Imports for type checking only, the submodules are imported lazily
+# on first access by the module __getattr__
+if TYPE_CHECKING:
+    from cliconfig.processing import base, builtin, create
+
+_LAZY_MODULES = {"base", "builtin", "create"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodules on first access."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the module, including the lazy submodules."""
+    return sorted(set(globals()) | _LAZY_MODULES)
+
+
+__all__ = ["base", "builtin", "create"]
@@ -1,9 +1,73 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Private module with AST parser for safe evaluation."""
 import ast
-from typing import Any, Callable, Dict, List
-
-import yaml
+import operator
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+# Path of the yaml file listing the allowed numpy, torch and tensorflow functions
+_ALLOWED_FUNCTIONS_PATH = os.path.join(
+    os.path.dirname(__file__), "allowed_functions.yaml"
+)
+
+# Types of the parameter values allowed in the expressions
+_ALLOWED_TYPES = (bool, int, float, complex, list, type(None))
+_ALLOWED_TYPES_SET = frozenset(_ALLOWED_TYPES)
+# Sentinel of the unknown parameters
+_MISSING = object()
+
+# Functions of the binary operators
+_BINOP_FUNCTIONS: Dict[Any, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.BitOr: lambda x, y: x or y,
+    ast.BitAnd: lambda x, y: x and y,
+    ast.MatMult: operator.matmul,
+}
+# Functions of the comparators
+_COMPARATOR_FUNCTIONS: Dict[Any, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+# Built-in functions allowed in the expressions
+_BUILTIN_FUNCTIONS: Dict[str, Callable] = {
+    "len": len,
+    "sum": sum,
+    "max": max,
+    "min": min,
+    "abs": abs,
+    "round": round,
+    "all": all,
+    "any": any,
+    "range": range,
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "list": list,
+    "tuple": tuple,
+    "dict": dict,
+    "set": set,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expr: str) -> Any:
+    """Parse an expression and return the root node of its AST.
+
+    The parsed trees are cached: the nodes are only read by `_process_node`.
+    """
+    return ast.parse(expr, mode="eval").body
 
 
 def _process_node(node: Any, flat_dict: dict) -> Any:
@@ -18,25 +82,10 @@ def _process_node(node: Any, flat_dict: dict) -> Any:
     # Case None, bool or number
     if isinstance(node, ast.Constant):
         return node.n
-    functions: Dict[Any, Callable[[Any, dict], Any]] = {
-        ast.BinOp: _process_binop,  # binary operation
-        ast.BoolOp: _process_boolop,  # boolean operation
-        ast.Compare: _process_comparator,  # comparison
-        ast.Name: _process_param_name,  # parameter name
-        ast.Attribute: _process_subconfig,  # sub-config
-        ast.IfExp: _process_ifexp,  # if/else
-        ast.List: _process_ltsd,  # list
-        ast.Tuple: _process_ltsd,  # tuple
-        ast.Set: _process_ltsd,  # set
-        ast.Dict: _process_ltsd,  # dict
-        ast.Call: _process_call,  # function
-        ast.ListComp: _process_lsdcomp,  # comprehension list/set/dict
-        ast.SetComp: _process_lsdcomp,  # comprehension list/set/dict
-        ast.DictComp: _process_lsdcomp,  # comprehension list/set/dict
-        ast.comprehension: _process_comprehension,  # comprehension
-    }
-    if isinstance(node, tuple(functions.keys())):
-        return functions[type(node)](node, flat_dict)
+    # NOTE The AST nodes are not subclassed: dispatch on the exact type
+    function = _NODE_FUNCTIONS.get(type(node))
+    if function is not None:
+        return function(node, flat_dict)
     raise ValueError(f"Not supported node in expression (of type {type(node)}).")
 
 
@@ -44,20 +93,9 @@ def _process_binop(node: Any, flat_dict: dict) -> Any:
     """Process a binary operator node."""
     left_val = _process_node(node=node.left, flat_dict=flat_dict)
     right_val = _process_node(node=node.right, flat_dict=flat_dict)
-    operators: Dict[Any, Callable[[Any, Any], Any]] = {
-        ast.Add: lambda x, y: x + y,
-        ast.Sub: lambda x, y: x - y,
-        ast.Mult: lambda x, y: x * y,
-        ast.Div: lambda x, y: x / y,
-        ast.Pow: lambda x, y: x**y,
-        ast.FloorDiv: lambda x, y: x // y,
-        ast.Mod: lambda x, y: x % y,
-        ast.BitOr: lambda x, y: x or y,
-        ast.BitAnd: lambda x, y: x and y,
-        ast.MatMult: lambda x, y: x @ y,
-    }
-    if isinstance(node.op, tuple(operators.keys())):
-        return operators[type(node.op)](left_val, right_val)
+    function = _BINOP_FUNCTIONS.get(type(node.op))
+    if function is not None:
+        return function(left_val, right_val)
     raise ValueError(
         f"Invalid operator detected: {node.op}."
         "Please use only these ops: '+', '-', '*', '/', '**', "
@@ -66,62 +104,56 @@ def _process_binop(node: Any, flat_dict: dict) -> Any:
 
 
 def _process_boolop(node: Any, flat_dict: dict) -> Any:
-    """Process bool operator node."""
-    values = [
-        _process_node(node=nodeval, flat_dict=flat_dict) for nodeval in node.values
-    ]
-    operators: Dict[Any, Callable[[Any, Any], Any]] = {
-        ast.And: lambda x, y: x and y,
-        ast.Or: lambda x, y: x or y,
-    }
-    operator = operators[type(node.op)]
-    result = isinstance(node.op, ast.And)  # Neutral for the operation
-    for val in values:
-        result = operator(result, val)  # type: ignore
-    return result
+    """Process bool operator node.
+
+    The values are evaluated lazily: like in Python, the evaluation stops at the
+    first false value for `and` and at the first true value for `or`.
+    """
+    is_and = isinstance(node.op, ast.And)
+    for nodeval in node.values[:-1]:
+        value = _process_node(node=nodeval, flat_dict=flat_dict)
+        if bool(value) is not is_and:
+            return value
+    return _process_node(node=node.values[-1], flat_dict=flat_dict)
 
 
 def _process_comparator(node: Any, flat_dict: dict) -> Any:
     """Process a comparator node."""
     left_val = _process_node(node=node.left, flat_dict=flat_dict)
     right_val = _process_node(node=node.comparators[0], flat_dict=flat_dict)
-    operators: Dict[Any, Callable[[bool, bool], bool]] = {
-        ast.Eq: lambda x, y: x == y,
-        ast.NotEq: lambda x, y: x != y,
-        ast.Lt: lambda x, y: x < y,
-        ast.LtE: lambda x, y: x <= y,
-        ast.Gt: lambda x, y: x > y,
-        ast.GtE: lambda x, y: x >= y,
-    }
-    return operators[type(node.ops[0])](left_val, right_val)  # type: ignore
+    return _COMPARATOR_FUNCTIONS[type(node.ops[0])](left_val, right_val)
 
 
 def _process_param_name(node: Any, flat_dict: dict) -> Any:
     """Process a parameter name."""
-    name = node.id
-    if name in flat_dict:
-        if isinstance(flat_dict[name], (bool, int, float, complex, list, type(None))):
-            return flat_dict[name]
-        raise ValueError(
-            f"Invalid value in expression for parameter '{name}', "
-            f"found type {type(flat_dict[name])}, expected, None, bool, int, "
-            "float, complex or list."
-        )
-    raise ValueError(f"Unknown parameter '{name}'.")
+    return _lookup_name(name=node.id, flat_dict=flat_dict)
 
 
 def _process_subconfig(node: Any, flat_dict: dict) -> Any:
     """Process a sub-config."""
-    # Get recursively the attribute names
-    param_name = ""
+    # Get the attribute names from the last one to the global subconfig name
+    names = []
     while isinstance(node, ast.Attribute):
-        param_name = f"{node.attr}.{param_name}"
+        names.append(node.attr)
         node = node.value
-    # Add the global subconfig name and process the node containing the
-    # full flat parameter name
-    param_name = f"{node.id}.{param_name}"[:-1]  # Remove last dot
-    node = ast.Name(id=param_name, ctx=ast.Load())
-    return _process_node(node=node, flat_dict=flat_dict)
+    names.append(node.id)
+    # Look up the full flat parameter name
+    return _lookup_name(name=".".join(reversed(names)), flat_dict=flat_dict)
+
+
+def _lookup_name(name: str, flat_dict: dict) -> Any:
+    """Get the value of a parameter from its (flat) name."""
+    value = flat_dict.get(name, _MISSING)
+    if value is _MISSING:
+        raise ValueError(f"Unknown parameter '{name}'.")
+    # Check the exact type first, the subclasses are rare
+    if type(value) in _ALLOWED_TYPES_SET or isinstance(value, _ALLOWED_TYPES):
+        return value
+    raise ValueError(
+        f"Invalid value in expression for parameter '{name}', "
+        f"found type {type(value)}, expected, None, bool, int, "
+        "float, complex or list."
+    )
 
 
 def _process_ifexp(node: Any, flat_dict: dict) -> Any:
@@ -162,25 +194,6 @@ def _process_ltsd(node: Any, flat_dict: dict) -> Any:
 
 def _process_call(node: Any, flat_dict: dict) -> Any:
     """Process a function node."""
-    functions: Dict[str, Callable] = {
-        "len": len,
-        "sum": sum,
-        "max": max,
-        "min": min,
-        "abs": abs,
-        "round": round,
-        "all": all,
-        "any": any,
-        "range": range,
-        "bool": bool,
-        "int": int,
-        "float": float,
-        "str": str,
-        "list": list,
-        "tuple": tuple,
-        "dict": dict,
-        "set": set,
-    }
     args = [_process_node(node=arg, flat_dict=flat_dict) for arg in node.args]
     kwargs = {
         kwarg.arg: _process_node(node=kwarg.value, flat_dict=flat_dict)
@@ -188,7 +201,7 @@ def _process_call(node: Any, flat_dict: dict) -> Any:
     }
     if isinstance(node.func, ast.Name):
         func_name = node.func.id
-        value = functions[func_name](*args, **kwargs)
+        value = _BUILTIN_FUNCTIONS[func_name](*args, **kwargs)
         return value
 
     # ast.Attribute
@@ -213,25 +226,27 @@ def _find_function(node: Any, flat_dict: dict) -> Callable:
 
     if list_names[0] in flat_dict:
         obj = flat_dict[list_names[0]]
-    elif _filter_allowed(list_names=list_names):
-        obj = __import__(list_names[0])
-    else:
-        raise ValueError(
-            f"Package or function not allowed or not supported: {'.'.join(list_names)}"
-        )
-    for name in list_names[1:-1]:
+        for name in list_names[1:-1]:
+            obj = getattr(obj, name)
+        return getattr(obj, list_names[-1])
+    if _filter_allowed(list_names=list_names):
+        return _import_function(tuple(list_names))
+    raise ValueError(
+        f"Package or function not allowed or not supported: {'.'.join(list_names)}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _import_function(names: Tuple[str, ...]) -> Callable:
+    """Import an allowed function from its package and attribute names."""
+    obj = __import__(names[0])
+    for name in names[1:-1]:
         obj = getattr(obj, name)
-    func = getattr(obj, list_names[-1])
-    return func
+    return getattr(obj, names[-1])
 
 
 def _filter_allowed(list_names: List[str]) -> bool:
     """Filter the allowed functions."""
-    with open(
-        "cliconfig/processing/allowed_functions.yaml", encoding="utf-8"
-    ) as yaml_file:
-        allowed_funcs = yaml.safe_load(yaml_file)
-    list_names = list_names.copy()
     # jax and numpy share the same allowed functions, jax.random is also allowed
     list_names = list_names[1:] if list_names[0] == "jax" else list_names
 
@@ -240,10 +255,21 @@ def _filter_allowed(list_names: List[str]) -> bool:
     if list_names[0] in ("random", "math"):
         return True
     if list_names[0] in ("numpy", "torch", "tensorflow"):
-        return list_names[1] in allowed_funcs[list_names[0]]
+        return list_names[1] in _get_allowed_functions()[list_names[0]]
     return False
 
 
+@lru_cache(maxsize=None)
+def _get_allowed_functions() -> Dict[str, FrozenSet[str]]:
+    """Load the allowed functions of each package once, on first use."""
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(_ALLOWED_FUNCTIONS_PATH, encoding="utf-8") as yaml_file:
+        allowed_funcs = yaml.load(yaml_file, Loader=loader)
+    return {package: frozenset(names) for package, names in allowed_funcs.items()}
+
+
 def _process_lsdcomp(node: Any, flat_dict: dict) -> Any:
     """Process comprehension list, set or dict node."""
     generator = node.generators[0]
@@ -279,3 +305,23 @@ def _process_comprehension(node: Any, flat_dict: dict) -> Any:
         condition = all(_process_node(test, variables) for test in tests)
         if condition:
             yield variables
+
+
+# Functions to process each type of node
+_NODE_FUNCTIONS: Dict[Any, Callable[[Any, dict], Any]] = {
+    ast.BinOp: _process_binop,  # binary operation
+    ast.BoolOp: _process_boolop,  # boolean operation
+    ast.Compare: _process_comparator,  # comparison
+    ast.Name: _process_param_name,  # parameter name
+    ast.Attribute: _process_subconfig,  # sub-config
+    ast.IfExp: _process_ifexp,  # if/else
+    ast.List: _process_ltsd,  # list
+    ast.Tuple: _process_ltsd,  # tuple
+    ast.Set: _process_ltsd,  # set
+    ast.Dict: _process_ltsd,  # dict
+    ast.Call: _process_call,  # function
+    ast.ListComp: _process_lsdcomp,  # comprehension list/set/dict
+    ast.SetComp: _process_lsdcomp,  # comprehension list/set/dict
+    ast.DictComp: _process_lsdcomp,  # comprehension list/set/dict
+    ast.comprehension: _process_comprehension,  # comprehension
+}
@@ -4,8 +4,15 @@
 Used to make configuration object and run the routines in `cliconfig.process_routines`
 and `cliconfig.config_routines`.
 """
+from typing import Any, Dict, List, Tuple
+
 from cliconfig.base import Config
 
+# Sentinel for unset slots
+_MISSING = object()
+# Cache of the slot names of the processing classes
+_SLOT_NAMES: Dict[type, Tuple[str, ...]] = {}
+
 
 class Processing:
     """Processing base class.
@@ -17,8 +24,23 @@ class Processing:
 
     That are applied in the order defined
     by the order attribute in case of multiple processing.
+
+    .. note::
+        The base class and the built-in processings use `__slots__` for
+        their attributes but keep a `__dict__` (created on first use only),
+        so any other attribute can still be set on them and their sub-classes.
     """
 
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "premerge_order",
+        "postmerge_order",
+        "endbuild_order",
+        "presave_order",
+        "postload_order",
+    )
+
     def __init__(self) -> None:
         self.premerge_order = 0.0
         self.postmerge_order = 0.0
@@ -76,9 +98,36 @@ class Processing:
         """Equality operator.
 
         Two processing are equal if they are the same class and add the same
-        attributes (accessed with `__dict__`).
+        attributes (in `__slots__` or in `__dict__`).
         """
         equal = (
-            isinstance(__value, self.__class__) and self.__dict__ == __value.__dict__
+            isinstance(__value, self.__class__)
+            and _attributes(self) == _attributes(__value)
         )
         return equal
+
+
+def _attributes(processing: Processing) -> Dict[str, Any]:
+    """Get the attributes of a processing, in its slots or its __dict__."""
+    attributes = {}
+    for name in _slot_names(type(processing)):
+        value = getattr(processing, name, _MISSING)
+        if value is not _MISSING:
+            attributes[name] = value
+    attributes.update(getattr(processing, "__dict__", {}))
+    return attributes
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Get the names of the slots of a class and its parent classes."""
+    if cls not in _SLOT_NAMES:
+        names: List[str] = []
+        for parent_class in reversed(cls.__mro__):
+            slots = parent_class.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(
+                name for name in slots if name not in ("__dict__", "__weakref__")
+            )
+        _SLOT_NAMES[cls] = tuple(names)
+    return _SLOT_NAMES[cls]
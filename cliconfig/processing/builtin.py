@@ -4,8 +4,7 @@
 Built-in classes of the default processing used by the config routines
 `cliconfig.config_routines.make_config` and `cliconfig.config_routines.load_config`.
 """
-import ast
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple, Type
 
 from cliconfig.base import Config
 from cliconfig.dict_routines import unflatten
@@ -13,7 +12,7 @@ from cliconfig.process_routines import (
     merge_flat_paths_processing,
     merge_flat_processing,
 )
-from cliconfig.processing._ast_parser import _process_node
+from cliconfig.processing._ast_parser import _parse_expression, _process_node
 from cliconfig.processing._type_parser import _convert_type, _isinstance, _parse_type
 from cliconfig.processing.base import Processing
 from cliconfig.tag_routines import clean_all_tags, clean_tag, dict_clean_tags, is_tag_in
@@ -72,6 +71,8 @@ class ProcessMerge(Processing):
     error because the key `a.b` already exists in the dict.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self.premerge_order = -20.0
@@ -205,6 +206,8 @@ class ProcessCopy(Processing):
         (and the key was never copied), an error is raised.
     """
 
+    __slots__ = ("keys_to_copy", "current_value")
+
     def __init__(self) -> None:
         super().__init__()
         self.premerge_order = 0.0
@@ -341,6 +344,8 @@ class ProcessDef(Processing):
         malicious code.
     """
 
+    __slots__ = ("exprs", "values")
+
     def __init__(self) -> None:
         super().__init__()
         self.premerge_order = 0.0
@@ -351,8 +356,8 @@ class ProcessDef(Processing):
 
     def calc_func(self, expr: str, config: Config) -> Any:
         """Evaluate expression with ast."""
-        tree = ast.parse(expr, mode="eval")
-        return _process_node(node=tree.body, flat_dict=config.dict)
+        node = _parse_expression(expr)
+        return _process_node(node=node, flat_dict=config.dict)
 
     def premerge(self, flat_config: Config) -> Config:
         """Pre-merge processing."""
@@ -451,6 +456,8 @@ class ProcessTyping(Processing):
     evaluated after the merge with `dict2`.
     """
 
+    __slots__ = ("forced_types", "type_desc")
+
     def __init__(self) -> None:
         super().__init__()
         self.premerge_order = 0.0
@@ -560,6 +567,8 @@ class ProcessSelect(Processing):
         selected key doesn't contain a dot. It raises an error in this case.
     """
 
+    __slots__ = ("keys_that_select", "subconfigs_to_delete", "keys_to_keep")
+
     def __init__(self) -> None:
         super().__init__()
         self.keys_that_select: Set[str] = set()
@@ -677,6 +686,8 @@ class ProcessDelete(Processing):
         to delete parameter that is NOT present in the default configuration.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         # After all pre-merge processing
@@ -741,6 +752,8 @@ class ProcessNew(Processing):
         post-merge. It may no have influence in practice.
     """
 
+    __slots__ = ("new_vals", "new_vals_backup")
+
     def __init__(self) -> None:
         super().__init__()
         self.premerge_order = 30.0
@@ -828,6 +841,8 @@ class ProcessDict(Processing):
         the dict every time you want to modify the dict.
     """
 
+    __slots__ = ("keys_with_dict",)
+
     class PseudoDict:
         """Object containing a dict that dodges flattening."""
 
@@ -915,6 +930,8 @@ class ProcessCheckTags(Processing):
     checks for '@' in the keys. It raises an error if one is found.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         # NOTE: this processing is a special meta-processing that must be
@@ -941,6 +958,19 @@ class ProcessCheckTags(Processing):
         return flat_config
 
 
+_DEFAULT_PROCESSING_CLASSES: Tuple[Type[Processing], ...] = (
+    ProcessCheckTags,
+    ProcessMerge,
+    ProcessCopy,
+    ProcessDef,
+    ProcessTyping,
+    ProcessSelect,
+    ProcessDelete,
+    ProcessDict,
+    ProcessNew,
+)
+
+
 class DefaultProcessings:
     """Default list of built-in processings.
 
@@ -963,14 +993,8 @@ class DefaultProcessings:
     """
 
     def __init__(self) -> None:
+        # NOTE The processings keep a state during the build of a config
+        # so new instances are created each time
         self.list: List[Processing] = [
-            ProcessCheckTags(),
-            ProcessMerge(),
-            ProcessCopy(),
-            ProcessDef(),
-            ProcessTyping(),
-            ProcessSelect(),
-            ProcessDelete(),
-            ProcessDict(),
-            ProcessNew(),
+            process_class() for process_class in _DEFAULT_PROCESSING_CLASSES
         ]
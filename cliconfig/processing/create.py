@@ -233,6 +233,16 @@ def create_processing_keep_property(
 class _ProcessingValue(Processing):
     """Processing class for make_processing_value."""
 
+    __slots__ = (
+        "func",
+        "processing_type",
+        "regex",
+        "tag_name",
+        "order",
+        "persistent",
+        "matched_keys",
+    )
+
     def __init__(
         self,
         func: Union[Callable[[Any], Any], Callable[[Any, Config], Any]],
@@ -353,6 +363,8 @@ class _ProcessingValue(Processing):
 class _ProcessingKeepProperty(Processing):
     """Processing class for make_processing_keep_property."""
 
+    __slots__ = ("func", "regex", "tag_name", "properties")
+
     def __init__(
         self,
         func: Union[Callable[[Any], Any], Callable[[Any, Config], Any]],
@@ -5,8 +5,12 @@ Used by the processing objects.
 """
 import copy
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
+# Tag with its "@" prefix, until the end of the key part (or of the line)
+_TAG_REGEX = re.compile(r"@[^.\n]*")
+
 
 def clean_tag(flat_key: str, tag_name: str) -> str:
     """Clean a tag from a flat key.
@@ -47,6 +51,7 @@ def clean_tag(flat_key: str, tag_name: str) -> str:
     return flat_key
 
 
+@lru_cache(maxsize=8192)
 def clean_all_tags(flat_key: str) -> str:
     """Clean all tags from a flat key.
 
@@ -59,13 +64,14 @@ def clean_all_tags(flat_key: str) -> str:
     -------
     flat_key : str
         The cleaned flat key.
+
+    .. note::
+        The results are cached as the same keys are cleaned many times
+        during the build of a config.
     """
-    list_keys = flat_key.split(".")
-    for i, key in enumerate(list_keys):
-        key = re.sub(r"@.*", "", key)
-        list_keys[i] = key
-    flat_key = ".".join(list_keys)
-    return flat_key
+    if "@" not in flat_key:
+        return flat_key
+    return _TAG_REGEX.sub("", flat_key)
 
 
 def dict_clean_tags(flat_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
@@ -94,6 +100,7 @@ def dict_clean_tags(flat_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str
     return clean_dict, tagged_keys
 
 
+@lru_cache(maxsize=8192)
 def is_tag_in(flat_key: str, tag_name: str, *, full_key: bool = False) -> bool:
     """Check if a tag is in a flat key.
 
@@ -116,7 +123,13 @@ def is_tag_in(flat_key: str, tag_name: str, *, full_key: bool = False) -> bool:
     -------
     bool
         True if the tag is in the flat key, False otherwise.
+
+    .. note::
+        The results are cached as the same keys are checked by each
+        processing during the build of a config.
     """
+    if "@" not in flat_key:
+        return False
     if tag_name[0] == "@":
         tag_name = tag_name[1:]
     if not full_key:
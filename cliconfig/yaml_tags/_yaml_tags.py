@@ -1,10 +1,24 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Module to convert yaml tags in yaml file to python dict with  cliconfig tags."""
 
+import warnings
 from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+try:
+    # Use the LibYAML bindings when PyYAML was built with them (much faster)
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+    warnings.warn(
+        "PyYAML is installed without the LibYAML bindings, cliconfig falls back "
+        "to the pure Python yaml loader which is much slower. Install LibYAML "
+        "and reinstall PyYAML to speed up the config loading.",
+        stacklevel=2,
+    )
+
 
 class TaggedNode:
     """Node class for tagged tree (with yaml tags)."""
@@ -15,10 +29,9 @@ class TaggedNode:
         self.is_config = is_config
 
 
-def tagged_constructor(
-    loader: yaml.SafeLoader, tag_suffix: str, node: yaml.Node
-) -> Any:
+def tagged_constructor(loader: Any, tag_suffix: str, node: yaml.Node) -> Any:
     """Build a tagged tree node from yaml node."""
+    loader.has_tags = True
     if isinstance(node, yaml.ScalarNode):
         return TaggedNode(loader.construct_scalar(node), tag_suffix, is_config=False)
     if isinstance(node, yaml.SequenceNode):
@@ -28,11 +41,19 @@ def tagged_constructor(
     )
 
 
+class _TagLoader(_SafeLoader):  # pylint: disable=too-many-ancestors
+    """Safe yaml loader that builds tagged tree nodes from yaml tags."""
+
+    # Set to True when a tagged tree node is built
+    has_tags = False
+
+
+_TagLoader.add_multi_constructor("", tagged_constructor)
+
+
 def get_yaml_loader() -> Any:
     """Return a yaml loader to parse tags and build tagged tree."""
-    loader = yaml.SafeLoader
-    loader.add_multi_constructor("", tagged_constructor)  # type: ignore
-    return loader
+    return _TagLoader
 
 
 def insert_tags(tagged_tree: Any) -> Tuple[Any, Optional[str]]:
@@ -51,7 +72,7 @@ def insert_tags(tagged_tree: Any) -> Tuple[Any, Optional[str]]:
         if tag:
             tag = tag.replace("!", "")
         if isinstance(tagged_tree.value, str):
-            value = yaml.safe_load(tagged_tree.value)
+            value = yaml.load(tagged_tree.value, Loader=_SafeLoader)
         else:
             value = tagged_tree.value
         return value, tag
@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 import pytest_check as check
 
-from cliconfig.processing._ast_parser import _process_node
+from cliconfig.processing._ast_parser import _get_allowed_functions, _process_node
 
 
 def test_ast_parser() -> None:
@@ -38,6 +38,22 @@ def test_ast_parser() -> None:
     result = _process_node(node=tree.body, flat_dict=flat_dict)
     check.equal(result, ({"list": [11, 17]}, {2}))
 
+    # Case short-circuit of the boolean operators
+    flat_dict = {"param1": 0, "param2": [1]}
+    for expr, expected in [
+        ("param1 and unknown", 0),
+        ("param2 or unknown", [1]),
+        ("param2 and param1 or param2", [1]),
+        ("1 and 2 and 3", 3),
+        ("0 or [] or None", None),
+    ]:
+        tree = ast.parse(expr, mode="eval")
+        result = _process_node(node=tree.body, flat_dict=flat_dict)
+        check.equal(result, expected)
+    tree = ast.parse("param2 and unknown", mode="eval")
+    with pytest.raises(ValueError, match="Unknown parameter 'unknown'."):
+        _process_node(node=tree.body, flat_dict=flat_dict)
+
     flat_dict = {"a": {"b": 1}}
     expr = "list(a.keys())"
     tree = ast.parse(expr, mode="eval")
@@ -115,3 +131,15 @@ def test_ast_parser() -> None:
         match="Package or function not allowed or not supported: logml.Logger",
     ):
         _process_node(node=tree.body, flat_dict=flat_dict)
+
+
+def test_get_allowed_functions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _get_allowed_functions."""
+    # The file is found from any working directory
+    monkeypatch.chdir("tests")
+    _get_allowed_functions.cache_clear()
+    allowed_funcs = _get_allowed_functions()
+    check.equal(set(allowed_funcs), {"numpy", "torch", "tensorflow"})
+    check.is_in("array", allowed_funcs["numpy"])
+    check.is_not_in("save", allowed_funcs["numpy"])
+    check.is_(_get_allowed_functions(), allowed_funcs)
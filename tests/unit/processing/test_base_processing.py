@@ -1,10 +1,12 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Test base class of processing."""
+import weakref
 
 import pytest_check as check
 
 from cliconfig.base import Config
 from cliconfig.processing.base import Processing
+from cliconfig.processing.builtin import ProcessTyping
 
 
 def test_processing() -> None:
@@ -36,5 +38,32 @@ def test_processing() -> None:
     check.equal(proc1, proc2)
     proc2.attr = 1
     check.not_equal(proc1, proc2)
+    proc2.attr = 0
+    proc2.premerge_order = 1.0  # Attribute in the slots
+    check.not_equal(proc1, proc2)
+
+    class _SlotsProcessingTest(Processing):
+        __slots__ = ("attr",)
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.attr = 0
+
+    proc3 = _SlotsProcessingTest()
+    proc4 = _SlotsProcessingTest()
+    check.equal(proc3, proc4)
+    proc4.attr = 1
+    check.not_equal(proc3, proc4)
+    proc4.attr = 0
+    # Attributes outside the slots can still be set
+    proc4.other_attr = 0  # type: ignore
+    check.not_equal(proc3, proc4)
+    proc3.other_attr = 0  # type: ignore
+    check.equal(proc3, proc4)
+    # Built-in processings also accept new attributes and weak references
+    proc_typing = ProcessTyping()
+    proc_typing.other_attr = 0  # type: ignore
+    check.equal(proc_typing.other_attr, 0)  # type: ignore
+    check.is_(weakref.ref(proc_typing)(), proc_typing)
     # Check repr
     check.equal(repr(proc1), "_ProcessingTest")
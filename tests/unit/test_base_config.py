@@ -1,6 +1,7 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Test base class of configuration."""
 
+import pytest
 import pytest_check as check
 
 from cliconfig.base import Config
@@ -8,7 +9,7 @@ from cliconfig.dict_routines import unflatten
 from cliconfig.processing.base import Processing
 
 
-def test_config(process_add1: Processing) -> None:
+def test_config(process_add1: Processing, process_keep: Processing) -> None:
     """Test base class of configuration."""
     config_dict = {"a.b": 1, "b": 2, "c.d.e": 3, "c.d.f": [2, 3]}
     config_dict = unflatten(config_dict)
@@ -24,11 +25,26 @@ def test_config(process_add1: Processing) -> None:
     check.not_equal(config, config3)
     config4 = Config(config_dict2, [])
     check.not_equal(config, config4)
+    # The order of the processings doesn't matter
+    config5 = Config(config_dict, [process_add1, process_keep])
+    config6 = Config(config_dict2, [process_keep, process_add1])
+    check.equal(config5, config6)
     # Test get/set attribute
     config = Config(config_dict, [process_add1])
     check.equal(config.a.b, 1)
     check.equal(config.c.d.f, [2, 3])
+    with pytest.raises(
+        AttributeError,
+        match="Config has no attribute 'd'. Available keys are: a, b, c.",
+    ):
+        _ = config.d
     check.equal(config.c.d, Config({"e": 3, "f": [2, 3]}, [process_add1]))
+    # Sub-configs are cached while they wrap the same dict
+    check.is_(config.c.d, config.c.d)
+    setattr(config, "c", {"d": {"e": 4}})
+    check.equal(config.c.d.e, 4)
+    config.dict["c"] = {"d": {"e": 3, "f": [2, 3]}}
+    check.equal(config.c.d.e, 3)
     config.a.b = 2
     check.equal(config.a.b, 2)
     config.c.d.f = [3, 4]
@@ -47,3 +63,9 @@ def test_config(process_add1: Processing) -> None:
     config = Config({"a": 1, "b": {"c": 3}})
     check.equal(dir(config), ["a", "b", "dict", "process_list"])
     check.equal(dir(config.b), ["c", "dict", "process_list"])
+    # Reserved names are the attributes and not the keys of the dict
+    config = Config({"dict": 1, "process_list": 2, "_sub_configs": 3})
+    check.equal(config.dict, {"dict": 1, "process_list": 2, "_sub_configs": 3})
+    check.equal(config.process_list, [])
+    check.is_none(config._sub_configs)  # pylint: disable=protected-access
+    check.equal(config.dict["_sub_configs"], 3)
@@ -2,8 +2,9 @@
 """Test for cli_parser.py."""
 import pytest
 import pytest_check as check
+import yaml
 
-from cliconfig.cli_parser import parse_cli
+from cliconfig.cli_parser import _MISSING, _fast_scalar, _parse_cli_cached, parse_cli
 
 
 def test_parse_cli() -> None:
@@ -35,3 +36,35 @@ def test_parse_cli() -> None:
     check.equal(config_cli_params, val2)
     with pytest.raises(ValueError, match="Only one '--config ' argument is allowed.*"):
         parse_cli(["main.py", "--config", "config1.yaml", "--config", "config2.yaml"])
+    with pytest.raises(ValueError, match="Missing config path.*"):
+        parse_cli(["main.py", "--a=1", "--config"])
+
+
+def test_parse_cli_cached() -> None:
+    """Test for _parse_cli_cached."""
+    sys_argv = ["main.py", "--config", "config1.yaml", "--a=[1, 2]", "--b"]
+    config_paths, config_cli_params = _parse_cli_cached(sys_argv)
+    check.equal((config_paths, config_cli_params), parse_cli(sys_argv))
+    # The outputs are copies
+    config_paths.append("config2.yaml")
+    config_cli_params["a"].append(3)
+    del config_cli_params["b"]
+    check.equal(_parse_cli_cached(sys_argv), parse_cli(sys_argv))
+
+
+def test_fast_scalar() -> None:
+    """Test for _fast_scalar."""
+    values = [
+        *["", "~", "null", "None", "true", "False", "yes", "off", "y", "n"],
+        *["0", "-0", "+12", "012", "0x1f", "1_000", "1:30"],
+        *["1.5", "-1.", ".5", "1e5", "1.0e5", "1.0e+5", "1.0E-5", ".inf", "nan"],
+        *["abc", "a.b", "path/to/config.yaml", "a-b", "_a", "2023-01-01", "a:b"],
+    ]
+    for value_str in values:
+        value = _fast_scalar(value_str)
+        if value is not _MISSING:
+            expected = yaml.safe_load(value_str)
+            check.equal(value, expected)
+            check.equal(type(value), type(expected))
+    check.is_(_fast_scalar("[1, 2]"), _MISSING)
+    check.is_(_fast_scalar("'a'"), _MISSING)
@@ -9,6 +9,7 @@ import pytest_check as check
 
 from cliconfig.base import Config
 from cliconfig.config_routines import (
+    _flatten_filter_cli_params,
     copy_config,
     flatten_config,
     load_config,
@@ -18,6 +19,7 @@ from cliconfig.config_routines import (
     unflatten_config,
     update_config,
 )
+from cliconfig.dict_routines import save_dict
 from cliconfig.processing.base import Processing
 from cliconfig.processing.builtin import ProcessCopy
 
@@ -130,20 +132,71 @@ def test_make_config(
     )
     check.equal(config.unknown, 0)
 
+    # Duplicated additional configs are merged at each position
+    sys.argv = [
+        "tests/test_make_config.py.py",
+        "--config",
+        "[tests/configs/config2.yaml,tests/configs/config1.yaml,"
+        "tests/configs/config2.yaml]",
+    ]
+    caplog.clear()
+    config = make_config(
+        "tests/configs/default1.yaml",
+        "tests/configs/default2.yaml",
+    )
+    check.equal(config.param1, 4)
+    check.equal(config.letters.letter1, "f")
+    check.equal(config.letters.letter2, "e")
+    check.is_in("3 additional config(s)", caplog.text)
+    # The processings still protect the keys of the first occurrence
+    save_dict({"b": 2, "d": 0}, "tests/tmp/default.yaml")
+    save_dict({"d@copy": "b"}, "tests/tmp/copy.yaml")
+    save_dict({"d": 5}, "tests/tmp/modify.yaml")
+    sys.argv = [
+        "tests/test_make_config.py.py",
+        "--config",
+        "[tests/tmp/copy.yaml,tests/tmp/modify.yaml,tests/tmp/copy.yaml]",
+    ]
+    with pytest.raises(
+        ValueError, match="Found attempt to modify a key with '@copy' tag.*"
+    ):
+        make_config("tests/tmp/default.yaml")
+    shutil.rmtree("tests/tmp")
+
     sys.argv = sys_argv.copy()
 
 
+def test_flatten_filter_cli_params() -> None:
+    """Test _flatten_filter_cli_params."""
+    flat_params_dict, new_keys = _flatten_filter_cli_params(
+        {
+            "a.b@tag": 1,
+            "a": {"c": 2, "z": 3, "e": {}},
+            "y@tag": 4,
+            "x@new": 5,
+        },
+        {"a.b": 0, "a.c": 0, "d": 0},
+    )
+    check.equal(flat_params_dict, {"a.b@tag": 1, "a.c": 2, "x@new": 5})
+    check.equal(new_keys, ["a.z", "y"])
+    with pytest.raises(ValueError, match="duplicated key 'a.b'"):
+        _flatten_filter_cli_params({"a.b": 1, "a": {"b": 2}}, {"a.b": 0})
+
+
 def test_load_config(process_add1: Processing) -> None:
     """Test and load_config."""
     # With default configs
+    process_list = [process_add1]
     config = load_config(
         "tests/configs/config2.yaml",
         default_config_paths=[
             "tests/configs/default1.yaml",
             "tests/configs/default2.yaml",
         ],
-        process_list=[process_add1],
+        process_list=process_list,
     )
+    # The input process list is not modified
+    check.equal(process_list, [process_add1])
     expected_config = {
         "param1": 4,
         "param2": 2,
@@ -210,6 +263,19 @@ def test_update_config(process_add1: Processing) -> None:
     }
     check.equal(new_config.dict, expected_dict)
 
+    # Without processing
+    config = Config({"a": 1, "b": {"c": 2, "d": [3]}}, [])
+    new_dict = {"b": {"c": 3}, "g": {"h": 4}}
+    new_config = update_config(config, new_dict, allow_new_keys=True)
+    check.equal(new_config.dict, {"a": 1, "b": {"c": 3, "d": [3]}, "g": {"h": 4}})
+    check.equal(config.dict, {"a": 1, "b": {"c": 2, "d": [3]}})
+    check.is_not(new_config.dict["g"], new_dict["g"])
+    config = Config({"a": 1, "b": {"c": 2, "d": [3]}, "e": {}}, [])
+    new_config = update_config(config, {"b.c": 4})
+    check.equal(new_config.dict, {"a": 1, "b": {"c": 4, "d": [3]}})
+    with pytest.raises(ValueError, match="New parameter found 'b.z'.*"):
+        update_config(config, {"b": {"z": 4}})
+
 
 def test_copy_config() -> None:
     """Test copy_config."""
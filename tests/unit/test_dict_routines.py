@@ -2,14 +2,18 @@
 """Tests for dict routines."""
 import os
 import shutil
+import sys
 
 import pytest
 import pytest_check as check
 from yaml.parser import ParserError
 
+import cliconfig
 from cliconfig.dict_routines import (
     _del_key,
+    _load_flat_dict,
     clean_pre_flat,
+    clear_yaml_cache,
     flatten,
     load_dict,
     merge_flat,
@@ -36,6 +40,8 @@ def test_flatten() -> None:
     )
     with pytest.raises(ValueError, match="duplicated key 'a.b'"):
         flatten({"a.b": 1, "a": {"b": 1}})
+    flat_dict = flatten({"c": {"d": {"e": 1}, "f": 2}, "a": 3, "b": {"g": {}}})
+    check.equal(list(flat_dict.items()), [("c.d.e", 1), ("c.f", 2), ("a", 3)])
 
 
 def test_unflatten() -> None:
@@ -44,8 +50,14 @@ def test_unflatten() -> None:
         unflatten({"a.b": 1, "a.c": 2, "c": 3}),
         {"a": {"b": 1, "c": 2}, "c": 3},
     )
+    check.equal(
+        unflatten({"a.b.c": 1, "a.d": 2, "e": {"f": 3}}),
+        {"a": {"b": {"c": 1}, "d": 2}, "e": {"f": 3}},
+    )
     with pytest.raises(ValueError, match="The dict must be flatten.*"):
         unflatten({"a.b": 1, "a": {"c": 2}})
+    with pytest.raises(ValueError, match="The dict must be flatten.*"):
+        unflatten({"a": 1, "a.b": 2})
 
 
 def test_merge_flat() -> None:
@@ -58,6 +70,18 @@ def test_merge_flat() -> None:
     )
     with pytest.raises(ValueError, match="New parameter found 'c'.*"):
         merge_flat(dict1, dict2, allow_new_keys=False)
+    # Case nothing to merge
+    dict1 = {"a.b": 1, "a.c": 2}
+    flat_dict = merge_flat(dict1, {}, allow_new_keys=False)
+    check.equal(flat_dict, dict1)
+    check.is_not(flat_dict, dict1)
+    check.equal(merge_flat(dict1, dict1, allow_new_keys=False), dict1)
+    check.equal(merge_flat({}, {"a": {"b": 1}}), {"a.b": 1})
+    # Case inplace
+    dict1 = {"a.b": 1, "a.c": 2}
+    flat_dict = merge_flat(dict1, {"a.c": 3}, inplace=True)
+    check.is_(flat_dict, dict1)
+    check.equal(dict1, {"a.b": 1, "a.c": 3})
     dict1 = {"a.b": 1, "a": {"b": 1, "c": 2}}
     with pytest.raises(
         ValueError,
@@ -143,8 +167,19 @@ def test_clean_pre_flat() -> None:
         clean_pre_flat({"a.b": 1, "a": {"b": 2}, "c": 3}, priority="unflat"),
         {"a": {"b": 2}, "c": 3},
     )
+    check.equal(
+        clean_pre_flat({"a.b": 1, "a.c": 2}, priority="unflat"),
+        {"a.b": 1, "a.c": 2},
+    )
+    check.equal(
+        clean_pre_flat({"a": {"b": 2}, "c": 3}, priority="flat"),
+        {"a": {"b": 2}, "c": 3},
+    )
     with pytest.raises(ValueError, match="duplicated key 'a.b'"):
         clean_pre_flat({"a.b": 1, "a": {"b": 2}, "c": 3}, priority="error")
+    # Conflict inside the nested part only
+    with pytest.raises(ValueError, match="duplicated key 'a.b.c'"):
+        clean_pre_flat({"a": {"b.c": 1, "b": {"c": 2}}}, priority="flat")
     with pytest.raises(
         ValueError,
         match=(
@@ -184,7 +219,41 @@ def test_save_load_dict() -> None:
         load_dict("tests/configs/wrong.yaml")
 
 
-def test_show_dict() -> None:
+def test_load_dict_cache() -> None:
+    """Test cache of load_dict."""
+    clear_yaml_cache()
+    save_dict({"a": 1, "b": [2, 3]}, "tests/tmp/config.yaml")
+    dict1 = load_dict("tests/tmp/config.yaml")
+    dict1["b"].append(4)  # Should not modify the cached dict
+    dict2 = load_dict("tests/tmp/config.yaml")
+    check.equal(dict2, {"a": 1, "b": [2, 3]})
+    check.is_not(dict1, dict2)
+    # Modifying the file invalidates the cache
+    save_dict({"a": 1, "b": [2, 3], "c": 4}, "tests/tmp/config.yaml")
+    check.equal(load_dict("tests/tmp/config.yaml"), {"a": 1, "b": [2, 3], "c": 4})
+    cliconfig.clear_yaml_cache()
+    check.equal(load_dict("tests/tmp/config.yaml"), {"a": 1, "b": [2, 3], "c": 4})
+    shutil.rmtree("tests/tmp")
+
+
+def test_load_dict_interned_keys() -> None:
+    """Test that the keys of the loaded flat dicts are interned."""
+    clear_yaml_cache()
+    os.makedirs("tests/tmp", exist_ok=True)
+    with open("tests/tmp/flat.yaml", "w", encoding="utf-8") as cfg_file:
+        cfg_file.write("model.layer.size: 1\nmodel.layer.name: dense\n")
+    size_key = sys.intern("".join(["model.layer", ".size"]))
+    name_key = sys.intern("".join(["model.layer", ".name"]))
+    flat_dict = _load_flat_dict("tests/tmp/flat.yaml")
+    check.equal(flat_dict, {"model.layer.size": 1, "model.layer.name": "dense"})
+    check.is_(list(flat_dict)[0], size_key)
+    check.is_(list(flat_dict)[1], name_key)
+    # Also from the cache
+    check.is_(list(_load_flat_dict("tests/tmp/flat.yaml"))[0], size_key)
+    shutil.rmtree("tests/tmp")
+
+
+def test_show_dict(capsys: pytest.CaptureFixture) -> None:
     """Test show_dict."""
     in_dict = {
         "model": {
@@ -216,3 +285,11 @@ def test_show_dict() -> None:
         },
     }
     show_dict(in_dict)
+    show_dict({"a.b": "c", "d": None}, start_indent=1)
+    show_dict({})
+    lines = capsys.readouterr().out.splitlines()
+    check.equal(len(lines), 25)
+    check.equal(lines[:3], ["model: ", "    s1_ae_config: ", "        in_dim: 2"])
+    check.equal(lines[4], "        layer_channels: [16, 32, 64]")
+    check.equal(lines[19], "    dataset: 'mnist'")
+    check.equal(lines[-3:], ["    a: ", "        b: 'c'", "    d: None"])
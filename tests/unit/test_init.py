@@ -0,0 +1,28 @@
+# Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
+"""Test the lazy imports of the package."""
+import pytest
+import pytest_check as check
+
+import cliconfig
+
+
+def test_lazy_imports() -> None:
+    """Test the access to the lazily imported sub-modules and objects."""
+    check.is_(
+        cliconfig.processing.builtin.DefaultProcessings,
+        cliconfig.DefaultProcessings,
+    )
+    check.is_(cliconfig.processing.base.Processing, cliconfig.Processing)
+    check.is_(
+        cliconfig.processing.create.create_processing_value,
+        cliconfig.create_processing_value,
+    )
+    check.is_(cliconfig.dict_routines.flatten, cliconfig.flatten_dict)
+    check.is_true(callable(cliconfig.yaml_tags._yaml_tags.insert_tags))
+    for name in cliconfig.__all__:
+        check.is_true(hasattr(cliconfig, name))
+    check.is_in("builtin", dir(cliconfig.processing))
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        _ = cliconfig.unknown  # type: ignore
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        _ = cliconfig.processing.unknown  # type: ignore
@@ -1,5 +1,9 @@
 # Copyright (c) 2023 Valentin Goldite. All Rights Reserved.
 """Tests for dict routines."""
+import logging
+import os
+import sys
+
 import pytest
 import pytest_check as check
 
@@ -9,6 +13,7 @@ from cliconfig._logger import create_logger
 def test_create_logger(
     caplog: pytest.CaptureFixture,
     capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test create_logger."""
     logger = create_logger()
@@ -20,3 +25,31 @@ def test_create_logger(
     check.is_true("WARNING  cliconfig._logger:test_logger.py:" in caplog.text)
     check.is_true(" This is a warning message." in caplog.text)
     check.is_true("WARNING - This is a warning message." in capsys.readouterr().out)
+    # The handler is not duplicated
+    logger = create_logger()
+    check.equal(len(logger.handlers), 1)
+    logger.info("This is another info message.")
+    check.equal(
+        capsys.readouterr().out.count("INFO - This is another info message."), 1
+    )
+    # The old stream of the handler may be closed
+    # pylint: disable=consider-using-with
+    old_stream = open(os.devnull, "w", encoding="utf-8")
+    logger.handlers[0].stream = old_stream  # type: ignore
+    old_stream.close()
+    logger = create_logger()
+    check.is_(logger.handlers[0].stream, sys.stdout)  # type: ignore
+    logger.info("This is an info message after closing.")
+    check.is_true(
+        "INFO - This is an info message after closing." in capsys.readouterr().out
+    )
+    # Quiet mode
+    monkeypatch.setenv("CLICONFIG_QUIET", "1")
+    logger = create_logger()
+    logger.info("This is a quiet info message.")
+    logger.warning("This is a quiet warning message.")
+    out = capsys.readouterr().out
+    check.is_false("This is a quiet info message." in out)
+    check.is_true("WARNING - This is a quiet warning message." in out)
+    monkeypatch.delenv("CLICONFIG_QUIET")
+    check.equal(create_logger().level, logging.INFO)
@@ -50,6 +50,18 @@ def test_merge_flat_processing(
     check.equal(config.process_list, [proc1, proc2, process_add1, process_keep])
     check.equal(process_keep.keep_vals, {})
 
+    # No processing
+    config = merge_flat_processing(
+        Config({"a": {"b": 1, "c@add1": 2}}, []),
+        Config({"a.b": 3}, []),
+        allow_new_keys=False,
+    )
+    check.equal(config, Config({"a.b": 3, "a.c@add1": 2}, []))
+    with pytest.raises(ValueError, match="New parameter found 'c'.*"):
+        merge_flat_processing(
+            Config({"a": 1}, []), Config({"c": 2}, []), allow_new_keys=False
+        )
+
 
 def test_merge_flat_paths_processing(
     process_add1: ProcessAdd1,